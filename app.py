@@ -1,38 +1,75 @@
 """
 Hotel Management System - Flask Web Application
 """
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
-from datetime import datetime, timedelta
+from flask import Flask, Response, g, render_template, request, redirect, url_for, flash, jsonify
+from datetime import date, datetime, timedelta
 from hotel_manager import HotelManager
 import os
 import sqlite3
 
+def _load_secret_key() -> str:
+    """Load the session secret from the environment or a persisted file.
+
+    Generating a fresh random key on every import invalidated flash
+    messages across restarts/reloads and between workers.
+    """
+    key = os.environ.get('SECRET_KEY')
+    if key:
+        return key
+    key_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.secret_key')
+    try:
+        with open(key_file) as f:
+            return f.read().strip()
+    except OSError:
+        key = os.urandom(24).hex()
+        with open(key_file, 'w') as f:
+            f.write(key)
+        return key
+
+
 app = Flask(__name__)
-app.secret_key = os.urandom(24).hex()  # For flash messages
+app.secret_key = _load_secret_key()  # For flash messages
 
 # Initialize hotel manager
 manager = HotelManager()
 
+# Per-request query budget: endpoints issuing more queries than this are
+# logged so N+1 regressions get noticed
+QUERY_BUDGET = 8
+
+
+@app.before_request
+def _start_query_count():
+    g._query_count_start = manager.db.query_count
+
+
+@app.after_request
+def _check_query_budget(response):
+    start = getattr(g, '_query_count_start', None)
+    if start is not None:
+        used = manager.db.query_count - start
+        if used > QUERY_BUDGET:
+            app.logger.warning(
+                "Query budget exceeded: %s issued %d queries (budget %d)",
+                request.path, used, QUERY_BUDGET
+            )
+    return response
+
 
 @app.route('/')
 def index():
     """Dashboard/home page"""
     summary = manager.get_room_status_summary()
-    recent_reservations = manager.view_reservations()[:5]  # Last 5 reservations
-    
-    # Calculate statistics
-    total_revenue = sum(r['total_amount'] for r in manager.view_reservations() 
-                       if r['status'] == 'checked_out')
-    active_reservations = len([r for r in manager.view_reservations() 
-                              if r['status'] in ['confirmed', 'checked_in']])
-    
+    recent_reservations = manager.reservation.get_recent(5)  # Last 5 reservations
+    dashboard = manager.get_dashboard_stats()
+
     stats = {
         'total_rooms': summary['total'],
         'available_rooms': summary['available'],
         'occupied_rooms': summary['occupied'],
         'maintenance_rooms': summary['maintenance'],
-        'total_revenue': total_revenue,
-        'active_reservations': active_reservations
+        'total_revenue': dashboard['total_revenue'],
+        'active_reservations': dashboard['active_reservations']
     }
     
     return render_template('index.html', stats=stats, recent_reservations=recent_reservations)
@@ -42,12 +79,7 @@ def index():
 def rooms():
     """View all rooms"""
     status_filter = request.args.get('status', '')
-    all_rooms = manager.view_rooms()
-    
-    # Filter by status if provided
-    if status_filter:
-        all_rooms = [r for r in all_rooms if r['status'] == status_filter]
-    
+    all_rooms = manager.view_rooms(status_filter or None)
     return render_template('rooms.html', rooms=all_rooms, status_filter=status_filter)
 
 
@@ -63,9 +95,7 @@ def add_room():
             amenities = request.form.get('amenities', '')
             status = request.form.get('status', 'available')
             
-            # Use the room model directly to pass status
-            room_id = manager.room.add_room(room_number, room_type, price_per_night, capacity, amenities, status)
-            if room_id:
+            if manager.add_room(room_number, room_type, price_per_night, capacity, amenities, status):
                 flash('Room added successfully!', 'success')
                 return redirect(url_for('rooms'))
             else:
@@ -94,8 +124,8 @@ def check_availability():
         if check_in and check_out:
             try:
                 # Validate dates
-                datetime.strptime(check_in, "%Y-%m-%d")
-                datetime.strptime(check_out, "%Y-%m-%d")
+                date.fromisoformat(check_in)
+                date.fromisoformat(check_out)
                 available_rooms = manager.get_available_rooms(check_in, check_out)
             except ValueError:
                 flash('Error: Invalid date format! Use YYYY-MM-DD', 'error')
@@ -131,16 +161,15 @@ def new_reservation():
             address = request.form.get('address', '')
             
             # Validate dates
-            datetime.strptime(check_in, "%Y-%m-%d")
-            datetime.strptime(check_out, "%Y-%m-%d")
+            date.fromisoformat(check_in)
+            date.fromisoformat(check_out)
             
-            reservation_id = manager.make_reservation(
+            result = manager.make_reservation(
                 guest_name, phone, room_id, check_in, check_out, email, address
             )
-            
-            if reservation_id:
-                reservation = manager.reservation.get_reservation_by_id(reservation_id)
-                flash(f'Reservation created successfully! Reservation ID: {reservation_id}, Total: ${reservation["total_amount"]:.2f}', 'success')
+
+            if result:
+                flash(f'Reservation created successfully! Reservation ID: {result["reservation_id"]}, Total: ${result["total_amount"]:.2f}', 'success')
                 return redirect(url_for('reservations'))
             else:
                 flash('Error: Room not available or invalid room ID!', 'error')
@@ -187,7 +216,7 @@ def check_out(reservation_id):
     if request.method == 'POST':
         payment_method = request.form.get('payment_method', 'cash')
         
-        if manager.check_out_guest(reservation_id, payment_method):
+        if manager.check_out_guest(reservation_id, payment_method) is not None:
             flash(f'Guest checked out successfully! Total paid: ${reservation["total_amount"]:.2f}', 'success')
             return redirect(url_for('reservations'))
         else:
@@ -223,7 +252,7 @@ def update_room_status(room_id):
         return redirect(url_for('rooms'))
     
     try:
-        manager.room.update_room_status(room_id, new_status)
+        manager.update_room_status(room_id, new_status)
         flash(f'Room status updated to {new_status}!', 'success')
     except Exception as e:
         flash(f'Error: {str(e)}', 'error')
@@ -241,15 +270,9 @@ def api_available_rooms():
         return jsonify({'error': 'Missing check_in or check_out parameters'}), 400
     
     try:
-        available_rooms = manager.get_available_rooms(check_in, check_out)
-        rooms_data = [{
-            'room_id': room['room_id'],
-            'room_number': room['room_number'],
-            'room_type': room['room_type'],
-            'price_per_night': room['price_per_night'],
-            'capacity': room['capacity']
-        } for room in available_rooms]
-        return jsonify({'rooms': rooms_data})
+        # SQLite builds the JSON array; no per-row dict construction here
+        rooms_json = manager.room.get_available_rooms_json(check_in, check_out)
+        return Response('{"rooms": ' + rooms_json + '}', mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -2,18 +2,115 @@
 Database models and setup for Hotel Management System
 """
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional, List, Tuple
 
+# Hot queries are defined once at module scope so every call passes the
+# same string object and sqlite3's prepared-statement cache stays hot
+_Q_AVAILABLE_ROOMS = """
+    SELECT r.* FROM rooms r
+    LEFT JOIN reservations res ON res.room_id = r.room_id
+        AND res.status IN ('confirmed', 'checked_in')
+        AND res.check_in_date < ? AND res.check_out_date > ?
+    WHERE r.status = 'available'
+    AND res.reservation_id IS NULL
+    ORDER BY r.room_number
+"""
+
+_Q_AVAILABLE_ROOMS_JSON = """
+    SELECT json_group_array(json_object(
+        'room_id', room_id, 'room_number', room_number, 'room_type', room_type,
+        'price_per_night', price_per_night, 'capacity', capacity
+    ))
+    FROM (
+        SELECT r.room_id, r.room_number, r.room_type, r.price_per_night, r.capacity
+        FROM rooms r
+        LEFT JOIN reservations res ON res.room_id = r.room_id
+            AND res.status IN ('confirmed', 'checked_in')
+            AND res.check_in_date < ? AND res.check_out_date > ?
+        WHERE r.status = 'available'
+        AND res.reservation_id IS NULL
+        ORDER BY r.room_number
+    )
+"""
+
+_Q_ROOM_IS_AVAILABLE = """
+    SELECT 1 FROM rooms r
+    WHERE r.room_id = ? AND r.status = 'available'
+    AND NOT EXISTS (
+        SELECT 1 FROM reservations
+        WHERE room_id = r.room_id
+        AND status IN ('confirmed', 'checked_in')
+        AND check_in_date < ? AND check_out_date > ?
+    )
+    LIMIT 1
+"""
+
+_Q_RESERVATION_BY_ID = """
+    SELECT r.*, g.name as guest_name, g.phone as guest_phone,
+           rm.room_number, rm.room_type, rm.price_per_night
+    FROM reservations r
+    JOIN guests g ON r.guest_id = g.guest_id
+    JOIN rooms rm ON r.room_id = rm.room_id
+    WHERE r.reservation_id = ?
+"""
+
+_Q_ALL_RESERVATIONS = """
+    SELECT r.*, g.name as guest_name, g.phone as guest_phone,
+           rm.room_number, rm.room_type
+    FROM reservations r
+    JOIN guests g ON r.guest_id = g.guest_id
+    JOIN rooms rm ON r.room_id = rm.room_id
+    ORDER BY r.created_at DESC
+"""
+
+_Q_RESERVATIONS_BY_STATUS = """
+    SELECT r.*, g.name as guest_name, g.phone as guest_phone,
+           rm.room_number, rm.room_type
+    FROM reservations r
+    JOIN guests g ON r.guest_id = g.guest_id
+    JOIN rooms rm ON r.room_id = rm.room_id
+    WHERE r.status = ?
+    ORDER BY r.created_at DESC
+"""
+
+_Q_RECENT_RESERVATIONS = """
+    SELECT r.*, g.name as guest_name, g.phone as guest_phone,
+           rm.room_number, rm.room_type
+    FROM reservations r
+    JOIN guests g ON r.guest_id = g.guest_id
+    JOIN rooms rm ON r.room_id = rm.room_id
+    ORDER BY r.created_at DESC
+    LIMIT ?
+"""
+
 
 class Database:
     """Database manager for hotel management system"""
     
     def __init__(self, db_name: str = "hotel.db"):
         self.db_name = db_name
-        self.conn = sqlite3.connect(db_name, check_same_thread=False)
+        self.query_count = 0  # Running total, used for per-request budgets
+        self.conn = sqlite3.connect(db_name, check_same_thread=False, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
-        self.create_tables()
+        self._configure_connection()
+        # PRAGMA user_version tracks whether the schema exists, so the
+        # (idempotent but not free) DDL runs once per database file
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            self.create_tables()
+            self.conn.execute("PRAGMA user_version = 1")
+
+    def _configure_connection(self):
+        """Tune SQLite for mixed read/write web traffic"""
+        # WAL lets readers run concurrently with a writer; NORMAL sync
+        # cuts fsyncs per commit while staying durable enough for WAL
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA foreign_keys=ON")
     
     def create_tables(self):
         """Create all necessary database tables"""
@@ -73,20 +170,48 @@ class Database:
             )
         """)
         
+        # Indexes on hot filter/join columns so availability checks and
+        # status filters use index seeks instead of full table scans
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_res_room_status_dates
+            ON reservations(room_id, status, check_in_date, check_out_date)
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_res_status ON reservations(status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_res_created_at ON reservations(created_at DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_guests_phone ON guests(phone)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_rooms_status ON rooms(status)")
+
         self.conn.commit()
-    
+
     def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         """Execute a SELECT query and return results"""
+        self.query_count += 1
         cursor = self.conn.cursor()
         cursor.execute(query, params)
         return cursor.fetchall()
-    
-    def execute_update(self, query: str, params: tuple = ()) -> int:
-        """Execute an INSERT, UPDATE, or DELETE query and return last row id"""
+
+    def execute_update(self, query: str, params: tuple = (), commit: bool = True) -> int:
+        """Execute an INSERT, UPDATE, or DELETE query and return last row id
+
+        Pass commit=False inside a transaction() block so the caller
+        controls the durability boundary.
+        """
+        self.query_count += 1
         cursor = self.conn.cursor()
         cursor.execute(query, params)
-        self.conn.commit()
+        if commit:
+            self.conn.commit()
         return cursor.lastrowid
+
+    @contextmanager
+    def transaction(self):
+        """Group several mutations under a single commit"""
+        try:
+            yield
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
     
     def close(self):
         """Close database connection"""
@@ -108,28 +233,50 @@ class Room:
         """
         return self.db.execute_update(query, (room_number, room_type, price_per_night, capacity, amenities, status))
     
-    def get_all_rooms(self) -> List[sqlite3.Row]:
-        """Get all rooms"""
+    def add_rooms_bulk(self, rows: List[Tuple]) -> int:
+        """Insert many rooms in one transaction via executemany.
+
+        Each row is (room_number, room_type, price_per_night, capacity,
+        amenities). Rooms whose number already exists are skipped.
+        Returns the number of rows inserted.
+        """
+        with self.db.conn:
+            cursor = self.db.conn.executemany(
+                """
+                INSERT OR IGNORE INTO rooms (room_number, room_type, price_per_night, capacity, amenities)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            return cursor.rowcount
+
+    def get_all_rooms(self, status: Optional[str] = None) -> List[sqlite3.Row]:
+        """Get all rooms, optionally filtered by status"""
+        if status:
+            return self.db.execute_query(
+                "SELECT * FROM rooms WHERE status = ? ORDER BY room_number", (status,)
+            )
         return self.db.execute_query("SELECT * FROM rooms ORDER BY room_number")
     
     def get_available_rooms(self, check_in: str, check_out: str) -> List[sqlite3.Row]:
         """Get available rooms for given dates"""
-        query = """
-            SELECT r.* FROM rooms r
-            WHERE r.status = 'available'
-            AND r.room_id NOT IN (
-                SELECT room_id FROM reservations
-                WHERE status IN ('confirmed', 'checked_in')
-                AND (
-                    (check_in_date <= ? AND check_out_date > ?) OR
-                    (check_in_date < ? AND check_out_date >= ?) OR
-                    (check_in_date >= ? AND check_out_date <= ?)
-                )
-            )
-            ORDER BY r.room_number
-        """
-        return self.db.execute_query(query, (check_in, check_in, check_out, check_out, check_in, check_out))
+        # Anti-join instead of NOT IN: a room is available when no
+        # confirmed/checked_in reservation overlaps (existing.check_in <
+        # new.check_out AND existing.check_out > new.check_in)
+        return self.db.execute_query(_Q_AVAILABLE_ROOMS, (check_out, check_in))
     
+    def get_available_rooms_json(self, check_in: str, check_out: str) -> str:
+        """Get available rooms for given dates as a JSON array string
+
+        JSON assembly happens inside SQLite (json_group_array), so no
+        per-row Python dict construction is needed.
+        """
+        return self.db.execute_query(_Q_AVAILABLE_ROOMS_JSON, (check_out, check_in))[0][0]
+
+    def is_available(self, room_id: int, check_in: str, check_out: str) -> bool:
+        """Check whether a single room is available for the given dates"""
+        return bool(self.db.execute_query(_Q_ROOM_IS_AVAILABLE, (room_id, check_out, check_in)))
+
     def get_room_by_id(self, room_id: int) -> Optional[sqlite3.Row]:
         """Get room by ID"""
         result = self.db.execute_query("SELECT * FROM rooms WHERE room_id = ?", (room_id,))
@@ -187,47 +334,55 @@ class Reservation:
     
     def get_reservation_by_id(self, reservation_id: int) -> Optional[sqlite3.Row]:
         """Get reservation by ID"""
-        query = """
-            SELECT r.*, g.name as guest_name, g.phone as guest_phone,
-                   rm.room_number, rm.room_type, rm.price_per_night
-            FROM reservations r
-            JOIN guests g ON r.guest_id = g.guest_id
-            JOIN rooms rm ON r.room_id = rm.room_id
-            WHERE r.reservation_id = ?
-        """
-        result = self.db.execute_query(query, (reservation_id,))
+        result = self.db.execute_query(_Q_RESERVATION_BY_ID, (reservation_id,))
         return result[0] if result else None
     
-    def get_all_reservations(self) -> List[sqlite3.Row]:
-        """Get all reservations"""
-        query = """
-            SELECT r.*, g.name as guest_name, g.phone as guest_phone,
-                   rm.room_number, rm.room_type
-            FROM reservations r
-            JOIN guests g ON r.guest_id = g.guest_id
-            JOIN rooms rm ON r.room_id = rm.room_id
-            ORDER BY r.created_at DESC
-        """
-        return self.db.execute_query(query)
+    def get_status_and_room(self, reservation_id: int) -> Optional[sqlite3.Row]:
+        """Get just the status, room and amount of a reservation (no joins)"""
+        result = self.db.execute_query(
+            "SELECT status, room_id, total_amount FROM reservations WHERE reservation_id = ?",
+            (reservation_id,)
+        )
+        return result[0] if result else None
+
+    def get_all_reservations(self, status: Optional[str] = None) -> List[sqlite3.Row]:
+        """Get all reservations, optionally filtered by status"""
+        if status:
+            return self.db.execute_query(_Q_RESERVATIONS_BY_STATUS, (status,))
+        return self.db.execute_query(_Q_ALL_RESERVATIONS)
     
+    def get_recent(self, limit: int = 5) -> List[sqlite3.Row]:
+        """Get the most recently created reservations"""
+        return self.db.execute_query(_Q_RECENT_RESERVATIONS, (limit,))
+
     def update_reservation_status(self, reservation_id: int, status: str):
         """Update reservation status"""
         query = "UPDATE reservations SET status = ? WHERE reservation_id = ?"
         self.db.execute_update(query, (status, reservation_id))
     
-    def check_in(self, reservation_id: int):
-        """Check in a guest"""
-        self.update_reservation_status(reservation_id, "checked_in")
-        reservation = self.get_reservation_by_id(reservation_id)
-        if reservation:
-            Room(self.db).update_room_status(reservation['room_id'], 'occupied')
-    
-    def check_out(self, reservation_id: int):
-        """Check out a guest"""
-        self.update_reservation_status(reservation_id, "checked_out")
-        reservation = self.get_reservation_by_id(reservation_id)
-        if reservation:
-            Room(self.db).update_room_status(reservation['room_id'], 'available')
+    def check_in(self, reservation_id: int, room_id: int):
+        """Check in a guest (reservation and room updated in one transaction)"""
+        with self.db.transaction():
+            self.db.execute_update(
+                "UPDATE reservations SET status = 'checked_in' WHERE reservation_id = ?",
+                (reservation_id,), commit=False
+            )
+            self.db.execute_update(
+                "UPDATE rooms SET status = 'occupied' WHERE room_id = ?",
+                (room_id,), commit=False
+            )
+
+    def check_out(self, reservation_id: int, room_id: int):
+        """Check out a guest (reservation and room updated in one transaction)"""
+        with self.db.transaction():
+            self.db.execute_update(
+                "UPDATE reservations SET status = 'checked_out' WHERE reservation_id = ?",
+                (reservation_id,), commit=False
+            )
+            self.db.execute_update(
+                "UPDATE rooms SET status = 'available' WHERE room_id = ?",
+                (room_id,), commit=False
+            )
 
 
 class Payment:
@@ -244,6 +399,25 @@ class Payment:
         """
         return self.db.execute_update(query, (reservation_id, amount, payment_method))
     
+    def finalize(self, reservation_id: int, amount: float, payment_method: str, room_id: int):
+        """Record the payment and close out the stay in one transaction"""
+        with self.db.transaction():
+            self.db.execute_update(
+                """
+                INSERT INTO payments (reservation_id, amount, payment_method, payment_status)
+                VALUES (?, ?, ?, 'completed')
+                """,
+                (reservation_id, amount, payment_method), commit=False
+            )
+            self.db.execute_update(
+                "UPDATE reservations SET status = 'checked_out' WHERE reservation_id = ?",
+                (reservation_id,), commit=False
+            )
+            self.db.execute_update(
+                "UPDATE rooms SET status = 'available' WHERE room_id = ?",
+                (room_id,), commit=False
+            )
+
     def get_payments_by_reservation(self, reservation_id: int) -> List[sqlite3.Row]:
         """Get all payments for a reservation"""
         return self.db.execute_query(
@@ -2,10 +2,15 @@
 Hotel Management System - Main business logic
 """
 import sqlite3
-from datetime import datetime, timedelta
+import time
+from datetime import date
 from typing import Optional, List
 from database import Database, Room, Guest, Reservation, Payment
 
+# Safety-net TTL for the dashboard caches, in case a write bypasses the
+# manager (e.g. direct model access) and misses the invalidation hooks
+_CACHE_TTL = 2.0
+
 
 class HotelManager:
     """Main hotel management class"""
@@ -16,12 +21,22 @@ class HotelManager:
         self.guest = Guest(self.db)
         self.reservation = Reservation(self.db)
         self.payment = Payment(self.db)
-    
+        self._summary_cache = None
+        self._stats_cache = None
+        self._summary_time = 0.0
+        self._stats_time = 0.0
+
+    def _invalidate_caches(self):
+        """Drop cached dashboard aggregates after a write"""
+        self._summary_cache = None
+        self._stats_cache = None
+
     def add_room(self, room_number: str, room_type: str, price_per_night: float,
-                 capacity: int, amenities: str = "") -> bool:
+                 capacity: int, amenities: str = "", status: str = "available") -> bool:
         """Add a new room to the hotel"""
         try:
-            self.room.add_room(room_number, room_type, price_per_night, capacity, amenities)
+            self.room.add_room(room_number, room_type, price_per_night, capacity, amenities, status)
+            self._invalidate_caches()
             return True
         except sqlite3.IntegrityError:
             return False
@@ -38,83 +53,111 @@ class HotelManager:
         return self.guest.add_guest(name, phone, email, address)
     
     def make_reservation(self, guest_name: str, phone: str, room_id: int,
-                        check_in: str, check_out: str, email: str = "", address: str = "") -> Optional[int]:
-        """Make a reservation"""
+                        check_in: str, check_out: str, email: str = "", address: str = "") -> Optional[dict]:
+        """Make a reservation
+
+        Returns a dict with reservation_id and total_amount on success
+        (so callers don't have to re-fetch them), or None on failure.
+        """
         # Register or get guest
         guest_id = self.register_guest(guest_name, phone, email, address)
         
         # Check if room is available
-        available_rooms = self.get_available_rooms(check_in, check_out)
-        room_ids = [r['room_id'] for r in available_rooms]
-        
-        if room_id not in room_ids:
+        if not self.room.is_available(room_id, check_in, check_out):
             return None
         
         # Calculate total amount
         room = self.room.get_room_by_id(room_id)
-        check_in_date = datetime.strptime(check_in, "%Y-%m-%d")
-        check_out_date = datetime.strptime(check_out, "%Y-%m-%d")
-        nights = (check_out_date - check_in_date).days
+        nights = (date.fromisoformat(check_out) - date.fromisoformat(check_in)).days
         total_amount = room['price_per_night'] * nights
         
         # Create reservation
         reservation_id = self.reservation.create_reservation(
             guest_id, room_id, check_in, check_out, total_amount
         )
-        
-        return reservation_id
+        self._invalidate_caches()
+
+        return {'reservation_id': reservation_id, 'total_amount': total_amount}
     
     def check_in_guest(self, reservation_id: int) -> bool:
         """Check in a guest"""
-        reservation = self.reservation.get_reservation_by_id(reservation_id)
+        reservation = self.reservation.get_status_and_room(reservation_id)
         if not reservation or reservation['status'] != 'confirmed':
             return False
         
-        self.reservation.check_in(reservation_id)
+        self.reservation.check_in(reservation_id, reservation['room_id'])
+        self._invalidate_caches()
         return True
     
-    def check_out_guest(self, reservation_id: int, payment_method: str = "cash") -> bool:
-        """Check out a guest and process payment"""
-        reservation = self.reservation.get_reservation_by_id(reservation_id)
+    def check_out_guest(self, reservation_id: int, payment_method: str = "cash") -> Optional[float]:
+        """Check out a guest and process payment
+
+        Returns the amount paid on success, or None if the reservation
+        does not exist or the guest is not checked in.
+        """
+        reservation = self.reservation.get_status_and_room(reservation_id)
         if not reservation or reservation['status'] != 'checked_in':
-            return False
-        
-        # Process payment
-        self.payment.create_payment(reservation_id, reservation['total_amount'], payment_method)
+            return None
         
-        # Check out
-        self.reservation.check_out(reservation_id)
-        return True
+        # Payment, reservation status, and room status in one transaction
+        self.payment.finalize(
+            reservation_id, reservation['total_amount'], payment_method, reservation['room_id']
+        )
+        self._invalidate_caches()
+        return reservation['total_amount']
     
     def view_reservations(self, status: Optional[str] = None) -> List:
         """View all reservations, optionally filtered by status"""
-        all_reservations = self.reservation.get_all_reservations()
-        if status:
-            return [r for r in all_reservations if r['status'] == status]
-        return all_reservations
+        return self.reservation.get_all_reservations(status)
     
-    def view_rooms(self) -> List:
-        """View all rooms"""
-        return self.room.get_all_rooms()
+    def view_rooms(self, status: Optional[str] = None) -> List:
+        """View all rooms, optionally filtered by status"""
+        return self.room.get_all_rooms(status)
     
     def view_guests(self) -> List:
         """View all guests"""
         return self.guest.get_all_guests()
     
+    def update_room_status(self, room_id: int, status: str):
+        """Update a room's status"""
+        self.room.update_room_status(room_id, status)
+        self._invalidate_caches()
+
+    @staticmethod
+    def _cache_expired(cached_at: float) -> bool:
+        return time.monotonic() - cached_at > _CACHE_TTL
+
+    def get_dashboard_stats(self) -> dict:
+        """Get revenue and active reservation counts in a single query"""
+        if self._stats_cache is not None and not self._cache_expired(self._stats_time):
+            return self._stats_cache
+        row = self.db.execute_query("""
+            SELECT COALESCE(SUM(CASE WHEN status = 'checked_out' THEN total_amount ELSE 0 END), 0) AS revenue,
+                   COALESCE(SUM(CASE WHEN status IN ('confirmed', 'checked_in') THEN 1 ELSE 0 END), 0) AS active
+            FROM reservations
+        """)[0]
+        self._stats_cache = {'total_revenue': row['revenue'], 'active_reservations': row['active']}
+        self._stats_time = time.monotonic()
+        return self._stats_cache
+
     def get_room_status_summary(self) -> dict:
         """Get summary of room statuses"""
-        rooms = self.room.get_all_rooms()
-        summary = {
-            'total': len(rooms),
-            'available': sum(1 for r in rooms if r['status'] == 'available'),
-            'occupied': sum(1 for r in rooms if r['status'] == 'occupied'),
-            'maintenance': sum(1 for r in rooms if r['status'] == 'maintenance')
+        if self._summary_cache is not None and not self._cache_expired(self._summary_time):
+            return self._summary_cache
+        rows = self.db.execute_query("SELECT status, COUNT(*) AS c FROM rooms GROUP BY status")
+        counts = {row['status']: row['c'] for row in rows}
+        self._summary_cache = {
+            'total': sum(counts.values()),
+            'available': counts.get('available', 0),
+            'occupied': counts.get('occupied', 0),
+            'maintenance': counts.get('maintenance', 0)
         }
-        return summary
+        self._summary_time = time.monotonic()
+        return self._summary_cache
     
     def cancel_reservation(self, reservation_id: int) -> bool:
         """Cancel a reservation"""
-        reservation = self.reservation.get_reservation_by_id(reservation_id)
+        reservation = self.reservation.get_status_and_room(reservation_id)
         if not reservation or reservation['status'] not in ['pending', 'confirmed']:
             return False
         
@@ -124,7 +167,8 @@ class HotelManager:
         # If room was occupied, make it available again
         if reservation['status'] == 'checked_in':
             self.room.update_room_status(reservation['room_id'], 'available')
-        
+
+        self._invalidate_caches()
         return True
     
     def close(self):
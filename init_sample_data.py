@@ -21,12 +21,10 @@ def init_sample_data():
         ("401", "Presidential", 500.00, 6, "WiFi, TV, AC, Mini Bar, Living Room, Jacuzzi, Balcony"),
     ]
     
-    for room_number, room_type, price, capacity, amenities in rooms:
-        try:
-            manager.add_room(room_number, room_type, price, capacity, amenities)
-            print(f"✓ Added room {room_number}")
-        except Exception as e:
-            print(f"✗ Failed to add room {room_number}: {e}")
+    # One executemany in one transaction: a single prepared statement
+    # and a single commit for the whole batch
+    added = manager.room.add_rooms_bulk(rooms)
+    print(f"✓ Added {added} of {len(rooms)} rooms")
     
     print("\nSample data initialization complete!")
     print("You can now run 'python main.py' to start using the system.")
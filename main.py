@@ -1,266 +1,378 @@
-"""
-Hotel Management System - Command Line Interface
-"""
-from datetime import datetime, timedelta
-from hotel_manager import HotelManager
-
-
-class HotelCLI:
-    """Command Line Interface for Hotel Management System"""
-    
-    def __init__(self):
-        self.manager = HotelManager()
-    
-    def display_menu(self):
-        """Display main menu"""
-        print("\n" + "="*50)
-        print("    HOTEL MANAGEMENT SYSTEM")
-        print("="*50)
-        print("1. Add Room")
-        print("2. View All Rooms")
-        print("3. Check Room Availability")
-        print("4. Make Reservation")
-        print("5. View Reservations")
-        print("6. Check In Guest")
-        print("7. Check Out Guest")
-        print("8. View Guests")
-        print("9. Room Status Summary")
-        print("10. Cancel Reservation")
-        print("0. Exit")
-        print("="*50)
-    
-    def add_room(self):
-        """Add a new room"""
-        print("\n--- Add New Room ---")
-        try:
-            room_number = input("Room Number: ").strip()
-            room_type = input("Room Type (Single/Double/Suite/Presidential): ").strip()
-            price_per_night = float(input("Price per Night: "))
-            capacity = int(input("Capacity (number of guests): "))
-            amenities = input("Amenities (comma-separated, optional): ").strip()
-            
-            if self.manager.add_room(room_number, room_type, price_per_night, capacity, amenities):
-                print(f"✓ Room {room_number} added successfully!")
-            else:
-                print("✗ Error: Room number already exists!")
-        except ValueError:
-            print("✗ Error: Invalid input!")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-    
-    def view_rooms(self):
-        """View all rooms"""
-        print("\n--- All Rooms ---")
-        rooms = self.manager.view_rooms()
-        if not rooms:
-            print("No rooms found.")
-            return
-        
-        print(f"{'Room #':<10} {'Type':<15} {'Price/Night':<15} {'Capacity':<10} {'Status':<12}")
-        print("-" * 70)
-        for room in rooms:
-            print(f"{room['room_number']:<10} {room['room_type']:<15} "
-                  f"${room['price_per_night']:<14.2f} {room['capacity']:<10} {room['status']:<12}")
-    
-    def check_availability(self):
-        """Check room availability"""
-        print("\n--- Check Room Availability ---")
-        try:
-            check_in = input("Check-in Date (YYYY-MM-DD): ").strip()
-            check_out = input("Check-out Date (YYYY-MM-DD): ").strip()
-            
-            # Validate dates
-            datetime.strptime(check_in, "%Y-%m-%d")
-            datetime.strptime(check_out, "%Y-%m-%d")
-            
-            available_rooms = self.manager.get_available_rooms(check_in, check_out)
-            
-            if not available_rooms:
-                print("No available rooms for the selected dates.")
-                return
-            
-            print(f"\nAvailable Rooms ({len(available_rooms)}):")
-            print(f"{'ID':<5} {'Room #':<10} {'Type':<15} {'Price/Night':<15} {'Capacity':<10}")
-            print("-" * 60)
-            for room in available_rooms:
-                print(f"{room['room_id']:<5} {room['room_number']:<10} {room['room_type']:<15} "
-                      f"${room['price_per_night']:<14.2f} {room['capacity']:<10}")
-        except ValueError:
-            print("✗ Error: Invalid date format! Use YYYY-MM-DD")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-    
-    def make_reservation(self):
-        """Make a reservation"""
-        print("\n--- Make Reservation ---")
-        try:
-            check_in = input("Check-in Date (YYYY-MM-DD): ").strip()
-            check_out = input("Check-out Date (YYYY-MM-DD): ").strip()
-            
-            # Validate dates
-            datetime.strptime(check_in, "%Y-%m-%d")
-            datetime.strptime(check_out, "%Y-%m-%d")
-            
-            # Show available rooms
-            available_rooms = self.manager.get_available_rooms(check_in, check_out)
-            if not available_rooms:
-                print("No available rooms for the selected dates.")
-                return
-            
-            print("\nAvailable Rooms:")
-            for room in available_rooms:
-                print(f"ID: {room['room_id']} - {room['room_number']} ({room['room_type']}) - "
-                      f"${room['price_per_night']}/night")
-            
-            room_id = int(input("\nSelect Room ID: "))
-            
-            # Guest information
-            name = input("Guest Name: ").strip()
-            phone = input("Phone Number: ").strip()
-            email = input("Email (optional): ").strip()
-            address = input("Address (optional): ").strip()
-            
-            reservation_id = self.manager.make_reservation(
-                name, phone, room_id, check_in, check_out, email, address
-            )
-            
-            if reservation_id:
-                reservation = self.manager.reservation.get_reservation_by_id(reservation_id)
-                print(f"\n✓ Reservation created successfully!")
-                print(f"Reservation ID: {reservation_id}")
-                print(f"Total Amount: ${reservation['total_amount']:.2f}")
-            else:
-                print("✗ Error: Room not available or invalid room ID!")
-        except ValueError:
-            print("✗ Error: Invalid input!")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-    
-    def view_reservations(self):
-        """View all reservations"""
-        print("\n--- All Reservations ---")
-        reservations = self.manager.view_reservations()
-        if not reservations:
-            print("No reservations found.")
-            return
-        
-        print(f"{'ID':<5} {'Guest':<20} {'Room':<10} {'Check-in':<12} {'Check-out':<12} {'Amount':<12} {'Status':<15}")
-        print("-" * 100)
-        for res in reservations:
-            print(f"{res['reservation_id']:<5} {res['guest_name']:<20} {res['room_number']:<10} "
-                  f"{res['check_in_date']:<12} {res['check_out_date']:<12} "
-                  f"${res['total_amount']:<11.2f} {res['status']:<15}")
-    
-    def check_in_guest(self):
-        """Check in a guest"""
-        print("\n--- Check In Guest ---")
-        try:
-            reservation_id = int(input("Reservation ID: "))
-            
-            if self.manager.check_in_guest(reservation_id):
-                print("✓ Guest checked in successfully!")
-            else:
-                print("✗ Error: Reservation not found or already checked in!")
-        except ValueError:
-            print("✗ Error: Invalid reservation ID!")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-    
-    def check_out_guest(self):
-        """Check out a guest"""
-        print("\n--- Check Out Guest ---")
-        try:
-            reservation_id = int(input("Reservation ID: "))
-            payment_method = input("Payment Method (cash/card/online): ").strip() or "cash"
-            
-            if self.manager.check_out_guest(reservation_id, payment_method):
-                reservation = self.manager.reservation.get_reservation_by_id(reservation_id)
-                print("✓ Guest checked out successfully!")
-                print(f"Total Paid: ${reservation['total_amount']:.2f}")
-            else:
-                print("✗ Error: Reservation not found or guest not checked in!")
-        except ValueError:
-            print("✗ Error: Invalid reservation ID!")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-    
-    def view_guests(self):
-        """View all guests"""
-        print("\n--- All Guests ---")
-        guests = self.manager.view_guests()
-        if not guests:
-            print("No guests found.")
-            return
-        
-        print(f"{'ID':<5} {'Name':<25} {'Phone':<15} {'Email':<30}")
-        print("-" * 80)
-        for guest in guests:
-            print(f"{guest['guest_id']:<5} {guest['name']:<25} {guest['phone']:<15} "
-                  f"{guest['email'] or 'N/A':<30}")
-    
-    def room_status_summary(self):
-        """Display room status summary"""
-        print("\n--- Room Status Summary ---")
-        summary = self.manager.get_room_status_summary()
-        print(f"Total Rooms: {summary['total']}")
-        print(f"Available: {summary['available']}")
-        print(f"Occupied: {summary['occupied']}")
-        print(f"Maintenance: {summary['maintenance']}")
-    
-    def cancel_reservation(self):
-        """Cancel a reservation"""
-        print("\n--- Cancel Reservation ---")
-        try:
-            reservation_id = int(input("Reservation ID to cancel: "))
-            
-            if self.manager.cancel_reservation(reservation_id):
-                print("✓ Reservation cancelled successfully!")
-            else:
-                print("✗ Error: Reservation not found or cannot be cancelled!")
-        except ValueError:
-            print("✗ Error: Invalid reservation ID!")
-        except Exception as e:
-            print(f"✗ Error: {e}")
-    
-    def run(self):
-        """Run the CLI application"""
-        print("Welcome to Hotel Management System!")
-        
-        while True:
-            self.display_menu()
-            choice = input("\nEnter your choice: ").strip()
-            
-            if choice == "0":
-                print("\nThank you for using Hotel Management System!")
-                self.manager.close()
-                break
-            elif choice == "1":
-                self.add_room()
-            elif choice == "2":
-                self.view_rooms()
-            elif choice == "3":
-                self.check_availability()
-            elif choice == "4":
-                self.make_reservation()
-            elif choice == "5":
-                self.view_reservations()
-            elif choice == "6":
-                self.check_in_guest()
-            elif choice == "7":
-                self.check_out_guest()
-            elif choice == "8":
-                self.view_guests()
-            elif choice == "9":
-                self.room_status_summary()
-            elif choice == "10":
-                self.cancel_reservation()
-            else:
-                print("✗ Invalid choice! Please try again.")
-            
-            input("\nPress Enter to continue...")
-
-
-if __name__ == "__main__":
-    cli = HotelCLI()
-    cli.run()
-
+"""
+Hotel Management System - Command Line Interface
+"""
+import os
+import sys
+from datetime import date
+from hotel_manager import HotelManager
+
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+def _write_rows(lines):
+    """Emit pre-formatted lines with one writev syscall per batch.
+
+    The kernel gathers the buffers directly, so no giant joined string
+    is allocated. Falls back to a buffered write where os.writev is
+    unavailable (e.g. Windows).
+    """
+    sys.stdout.flush()  # keep ordering with buffered text output
+    if hasattr(os, 'writev'):
+        fd = sys.stdout.fileno()
+        bufs = [line.encode() for line in lines]
+        for i in range(0, len(bufs), _IOV_MAX):
+            os.writev(fd, bufs[i:i + _IOV_MAX])
+    else:
+        sys.stdout.writelines(lines)
+        sys.stdout.flush()
+
+# Row templates compiled once; their bound .format/.format_map methods
+# do the field lookup and padding in C instead of per-row f-strings
+# (sqlite3.Row supports the mapping protocol format_map needs)
+_ROOM_ROW_FMT = "{room_number:<10} {room_type:<15} ${price_per_night:<14.2f} {capacity:<10} {status:<12}\n"
+_RES_ROW_FMT = (
+    "{reservation_id:<5} {guest_name:<20} {room_number:<10} "
+    "{check_in_date:<12} {check_out_date:<12} ${total_amount:<11.2f} {status:<15}\n"
+)
+_GUEST_ROW_FMT = "{:<5} {:<25} {:<15} {:<30}\n"
+
+
+class HotelCLI:
+    """Command Line Interface for Hotel Management System"""
+
+    # Fixed banners/headers are built once and written in a single call
+    # instead of one print (and one write syscall) per line
+    _MENU_STR = (
+        "\n" + "=" * 50 + "\n"
+        "    HOTEL MANAGEMENT SYSTEM\n"
+        + "=" * 50 + "\n"
+        "1. Add Room\n"
+        "2. View All Rooms\n"
+        "3. Check Room Availability\n"
+        "4. Make Reservation\n"
+        "5. View Reservations\n"
+        "6. Check In Guest\n"
+        "7. Check Out Guest\n"
+        "8. View Guests\n"
+        "9. Room Status Summary\n"
+        "10. Cancel Reservation\n"
+        "0. Exit\n"
+        + "=" * 50 + "\n"
+    )
+
+    _ROOMS_HEADER = (
+        f"{'Room #':<10} {'Type':<15} {'Price/Night':<15} {'Capacity':<10} {'Status':<12}\n"
+        + "-" * 70 + "\n"
+    )
+
+    _AVAILABILITY_HEADER = (
+        f"{'ID':<5} {'Room #':<10} {'Type':<15} {'Price/Night':<15} {'Capacity':<10}\n"
+        + "-" * 60 + "\n"
+    )
+
+    _RESERVATIONS_HEADER = (
+        f"{'ID':<5} {'Guest':<20} {'Room':<10} {'Check-in':<12} {'Check-out':<12} "
+        f"{'Amount':<12} {'Status':<15}\n"
+        + "-" * 100 + "\n"
+    )
+
+    _GUESTS_HEADER = (
+        f"{'ID':<5} {'Name':<25} {'Phone':<15} {'Email':<30}\n"
+        + "-" * 80 + "\n"
+    )
+
+    # Section headers, precomputed with their trailing newline so each
+    # is a single write instead of a print() call
+    _HDR_ADD_ROOM = "\n--- Add New Room ---\n"
+    _HDR_ALL_ROOMS = "\n--- All Rooms ---\n"
+    _HDR_AVAILABILITY = "\n--- Check Room Availability ---\n"
+    _HDR_MAKE_RESERVATION = "\n--- Make Reservation ---\n"
+    _HDR_ALL_RESERVATIONS = "\n--- All Reservations ---\n"
+    _HDR_CHECK_IN = "\n--- Check In Guest ---\n"
+    _HDR_CHECK_OUT = "\n--- Check Out Guest ---\n"
+    _HDR_ALL_GUESTS = "\n--- All Guests ---\n"
+    _HDR_STATUS_SUMMARY = "\n--- Room Status Summary ---\n"
+    _HDR_CANCEL = "\n--- Cancel Reservation ---\n"
+
+    def __init__(self):
+        self.manager = HotelManager()
+        self._actions = {
+            "1": self.add_room,
+            "2": self.view_rooms,
+            "3": self.check_availability,
+            "4": self.make_reservation,
+            "5": self.view_reservations,
+            "6": self.check_in_guest,
+            "7": self.check_out_guest,
+            "8": self.view_guests,
+            "9": self.room_status_summary,
+            "10": self.cancel_reservation,
+        }
+
+    def display_menu(self):
+        """Display main menu"""
+        sys.stdout.write(self._MENU_STR)
+
+    def _prompt(self, msg: str) -> str:
+        """Prompt and read a line, skipping input()'s readline machinery"""
+        sys.stdout.write(msg)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:  # EOF, same behaviour as input()
+            raise EOFError
+        return line.strip()
+
+    def _prompt_int(self, msg: str):
+        """Prompt for an integer, returning None instead of raising on bad input"""
+        try:
+            return int(self._prompt(msg))
+        except ValueError:
+            return None
+    
+    def add_room(self):
+        """Add a new room"""
+        sys.stdout.write(self._HDR_ADD_ROOM)
+        try:
+            room_number = self._prompt("Room Number: ")
+            room_type = self._prompt("Room Type (Single/Double/Suite/Presidential): ")
+            price_per_night = float(self._prompt("Price per Night: "))
+            capacity = int(self._prompt("Capacity (number of guests): "))
+            amenities = self._prompt("Amenities (comma-separated, optional): ")
+            
+            if self.manager.add_room(room_number, room_type, price_per_night, capacity, amenities):
+                print(f"✓ Room {room_number} added successfully!")
+            else:
+                print("✗ Error: Room number already exists!")
+        except ValueError:
+            print("✗ Error: Invalid input!")
+        except Exception as e:
+            print(f"✗ Error: {e}")
+    
+    def view_rooms(self):
+        """View all rooms"""
+        sys.stdout.write(self._HDR_ALL_ROOMS)
+        rooms = self.manager.view_rooms()
+        if not rooms:
+            print("No rooms found.")
+            return
+        
+        fmt = _ROOM_ROW_FMT.format_map
+        lines = [self._ROOMS_HEADER]
+        lines.extend(fmt(room) for room in rooms)
+        _write_rows(lines)
+    
+    def check_availability(self):
+        """Check room availability"""
+        sys.stdout.write(self._HDR_AVAILABILITY)
+        try:
+            check_in = self._prompt("Check-in Date (YYYY-MM-DD): ")
+            check_out = self._prompt("Check-out Date (YYYY-MM-DD): ")
+            
+            # Validate dates (fromisoformat raises ValueError like strptime)
+            date.fromisoformat(check_in)
+            date.fromisoformat(check_out)
+            
+            available_rooms = self.manager.get_available_rooms(check_in, check_out)
+            
+            if not available_rooms:
+                print("No available rooms for the selected dates.")
+                return
+            
+            print(f"\nAvailable Rooms ({len(available_rooms)}):")
+            sys.stdout.write(self._AVAILABILITY_HEADER)
+            for room in available_rooms:
+                print(f"{room['room_id']:<5} {room['room_number']:<10} {room['room_type']:<15} "
+                      f"${room['price_per_night']:<14.2f} {room['capacity']:<10}")
+        except ValueError:
+            print("✗ Error: Invalid date format! Use YYYY-MM-DD")
+        except Exception as e:
+            print(f"✗ Error: {e}")
+    
+    def make_reservation(self):
+        """Make a reservation"""
+        sys.stdout.write(self._HDR_MAKE_RESERVATION)
+        try:
+            check_in = self._prompt("Check-in Date (YYYY-MM-DD): ")
+            check_out = self._prompt("Check-out Date (YYYY-MM-DD): ")
+            
+            # Validate dates (fromisoformat raises ValueError like strptime)
+            date.fromisoformat(check_in)
+            date.fromisoformat(check_out)
+            
+            # Show available rooms
+            available_rooms = self.manager.get_available_rooms(check_in, check_out)
+            if not available_rooms:
+                print("No available rooms for the selected dates.")
+                return
+            
+            print("\nAvailable Rooms:")
+            for room in available_rooms:
+                print(f"ID: {room['room_id']} - {room['room_number']} ({room['room_type']}) - "
+                      f"${room['price_per_night']}/night")
+            
+            room_id = self._prompt_int("\nSelect Room ID: ")
+
+            # Validate against the list we already fetched before asking
+            # for guest details or hitting the database again
+            valid_ids = {room['room_id'] for room in available_rooms}
+            if room_id not in valid_ids:
+                print("✗ Error: Room not available!")
+                return
+
+            # Guest information
+            name = self._prompt("Guest Name: ")
+            phone = self._prompt("Phone Number: ")
+            email = self._prompt("Email (optional): ")
+            address = self._prompt("Address (optional): ")
+            
+            result = self.manager.make_reservation(
+                name, phone, room_id, check_in, check_out, email, address
+            )
+
+            if result:
+                print(f"\n✓ Reservation created successfully!")
+                print(f"Reservation ID: {result['reservation_id']}")
+                print(f"Total Amount: ${result['total_amount']:.2f}")
+            else:
+                print("✗ Error: Room not available or invalid room ID!")
+        except ValueError:
+            print("✗ Error: Invalid input!")
+        except Exception as e:
+            print(f"✗ Error: {e}")
+    
+    def view_reservations(self):
+        """View all reservations"""
+        sys.stdout.write(self._HDR_ALL_RESERVATIONS)
+        reservations = self.manager.view_reservations()
+        if not reservations:
+            print("No reservations found.")
+            return
+        
+        fmt = _RES_ROW_FMT.format_map
+        lines = [self._RESERVATIONS_HEADER]
+        lines.extend(fmt(res) for res in reservations)
+        _write_rows(lines)
+    
+    def check_in_guest(self):
+        """Check in a guest"""
+        sys.stdout.write(self._HDR_CHECK_IN)
+        reservation_id = self._prompt_int("Reservation ID: ")
+        if reservation_id is None:
+            print("✗ Error: Invalid reservation ID!")
+            return
+        try:
+            if self.manager.check_in_guest(reservation_id):
+                print("✓ Guest checked in successfully!")
+            else:
+                print("✗ Error: Reservation not found or already checked in!")
+        except Exception as e:
+            print(f"✗ Error: {e}")
+    
+    def check_out_guest(self):
+        """Check out a guest"""
+        sys.stdout.write(self._HDR_CHECK_OUT)
+        reservation_id = self._prompt_int("Reservation ID: ")
+        if reservation_id is None:
+            print("✗ Error: Invalid reservation ID!")
+            return
+        try:
+            payment_method = self._prompt("Payment Method (cash/card/online): ") or "cash"
+
+            amount = self.manager.check_out_guest(reservation_id, payment_method)
+            if amount is not None:
+                print("✓ Guest checked out successfully!")
+                print(f"Total Paid: ${amount:.2f}")
+            else:
+                print("✗ Error: Reservation not found or guest not checked in!")
+        except Exception as e:
+            print(f"✗ Error: {e}")
+    
+    def view_guests(self):
+        """View all guests"""
+        sys.stdout.write(self._HDR_ALL_GUESTS)
+        guests = self.manager.view_guests()
+        if not guests:
+            print("No guests found.")
+            return
+        
+        # Positional template: the email column needs an 'N/A' fallback
+        # that format_map can't express
+        fmt = _GUEST_ROW_FMT.format
+        lines = [self._GUESTS_HEADER]
+        lines.extend(
+            fmt(guest['guest_id'], guest['name'], guest['phone'], guest['email'] or 'N/A')
+            for guest in guests
+        )
+        _write_rows(lines)
+    
+    def room_status_summary(self):
+        """Display room status summary"""
+        sys.stdout.write(self._HDR_STATUS_SUMMARY)
+        summary = self.manager.get_room_status_summary()
+        print(f"Total Rooms: {summary['total']}")
+        print(f"Available: {summary['available']}")
+        print(f"Occupied: {summary['occupied']}")
+        print(f"Maintenance: {summary['maintenance']}")
+    
+    def cancel_reservation(self):
+        """Cancel a reservation"""
+        sys.stdout.write(self._HDR_CANCEL)
+        reservation_id = self._prompt_int("Reservation ID to cancel: ")
+        if reservation_id is None:
+            print("✗ Error: Invalid reservation ID!")
+            return
+        try:
+            if self.manager.cancel_reservation(reservation_id):
+                print("✓ Reservation cancelled successfully!")
+            else:
+                print("✗ Error: Reservation not found or cannot be cancelled!")
+        except Exception as e:
+            print(f"✗ Error: {e}")
+    
+    def run(self):
+        """Run the CLI application"""
+        print("Welcome to Hotel Management System!")
+
+        # Block-buffer stdout for the session so each action's writes
+        # coalesce into one or two syscalls. _prompt flushes sys.stdout
+        # before reading, so prompts still appear immediately.
+        orig_stdout = sys.stdout
+        orig_stdout.flush()
+        sys.stdout = open(
+            orig_stdout.fileno(), mode='w', buffering=65536,
+            encoding=orig_stdout.encoding, errors=orig_stdout.errors,
+            closefd=False
+        )
+        try:
+            self._loop()
+        finally:
+            sys.stdout.flush()
+            sys.stdout = orig_stdout
+
+    def _loop(self):
+        """Main menu loop"""
+        while True:
+            self.display_menu()
+            choice = self._prompt("\nEnter your choice: ")
+            
+            if choice == "0":
+                print("\nThank you for using Hotel Management System!")
+                self.manager.close()
+                break
+
+            action = self._actions.get(choice)
+            if action:
+                action()
+            else:
+                print("✗ Invalid choice! Please try again.")
+            
+            self._prompt("\nPress Enter to continue...")
+
+
+if __name__ == "__main__":
+    cli = HotelCLI()
+    cli.run()
+